@@ -16,33 +16,254 @@ Environment Variables:
 """
 
 import argparse
+import asyncio
+import base64
+import datetime
+import functools
+import json
+import logging
 import os
+import shutil
 import sys
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.firefox.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from pyvirtualdisplay import Display
-from webdriver_manager.firefox import GeckoDriverManager
+
+log = logging.getLogger(__name__)
+
+# Cache directory for state reused across runs (cookies, browser profiles).
+# State is kept in one subdirectory per router so multi-router runs never
+# share a locked browser profile or restore another router's cookies.
+_CACHE_DIR = os.path.expanduser("~/.cache/asus_router_config")
+
+
+def _router_cache_dir(router_ip):
+    """Return the cache subdirectory holding state for one router."""
+    return os.path.join(_CACHE_DIR, router_ip)
+
+# Pinned geckodriver release for webdriver_manager downloads; pinning skips
+# the GitHub API call that resolves the latest version on every cold run
+_GECKODRIVER_VERSION = "v0.34.0"
+
+_selenium_loaded = False
+
+
+def _load_selenium():
+    """
+    Import selenium lazily, publishing the names at module level.
+
+    Selenium pulls in a couple of hundred transitive modules, which is
+    noticeable on a Raspberry Pi. Deferring the import keeps --help and
+    argument-validation failures near-instant; only paths that actually
+    drive a browser pay for it.
+    """
+    global _selenium_loaded, webdriver, By, WebDriverWait, EC, Options, Service
+    global ChromeOptions, ChromeService, TimeoutException, NoSuchElementException
+    if _selenium_loaded:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.firefox.options import Options
+    from selenium.webdriver.firefox.service import Service
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    _selenium_loaded = True
+
+
+def _load_requests():
+    """Import requests lazily; only the HTTP configurator needs it."""
+    global requests
+    import requests
+
+
+def _firefox_prefs(router_ip):
+    """
+    The fixed set of Firefox preferences the script runs with.
+
+    Returns:
+        Dict mapping preference names to values
+    """
+    return {
+        "browser.privatebrowsing.autostart": False,
+        "network.http.phishy-userpass-length": 255,
+        "network.automatic-ntlm-auth.trusted-uris": router_ip,
+        # Skip subresources that are irrelevant to submitting the filter form:
+        # no image decoding, no stylesheet fetch/parse, no plugins or autoplay
+        "permissions.default.image": 2,
+        "permissions.default.stylesheet": 2,
+        "javascript.enabled": True,  # keep - the form uses JS
+        "dom.ipc.plugins.enabled": False,
+        "media.autoplay.default": 5,
+        "browser.cache.disk.enable": False,
+        "browser.cache.memory.enable": True,
+        "browser.sessionhistory.max_entries": 2,
+    }
+
+
+def _profile_prefs_cached(prefs, profile_dir):
+    """
+    Check whether the persistent profile already carries exactly these prefs.
+
+    Returns:
+        True if the prefs written by a previous run match, False otherwise
+        (including when the profile has never been primed)
+    """
+    try:
+        with open(os.path.join(profile_dir, "prefs_template.json")) as f:
+            return json.load(f) == prefs
+    except (OSError, ValueError):
+        return False
+
+
+def _write_profile_prefs(prefs, profile_dir):
+    """
+    Materialize the prefs as user.js inside the persistent profile.
+
+    Firefox reads user.js natively on startup, so later runs can skip the
+    per-preference marshalling through geckodriver entirely. A JSON sidecar
+    records what was written so a changed pref set re-primes the profile.
+    """
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        with open(os.path.join(profile_dir, "user.js"), "w") as f:
+            for name, value in prefs.items():
+                f.write(f"user_pref({json.dumps(name)}, {json.dumps(value)});\n")
+        with open(os.path.join(profile_dir, "prefs_template.json"), "w") as f:
+            json.dump(prefs, f)
+    except OSError as e:
+        log.warning("Could not prime the Firefox profile: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_geckodriver():
+    """
+    Resolve the geckodriver binary path, cached for the process lifetime.
+
+    Resolution order: the GECKODRIVER_PATH environment variable, the snap
+    install location, any geckodriver on PATH, and finally webdriver_manager
+    pinned to a known release (which only downloads when missing from its
+    cache). Caching avoids repeating the filesystem checks and any
+    webdriver_manager network traffic on every driver setup.
+    """
+    env_path = os.getenv("GECKODRIVER_PATH")
+    if env_path:
+        log.info("Using geckodriver from GECKODRIVER_PATH: %s", env_path)
+        return env_path
+
+    snap_geckodriver = os.path.join('/snap', 'bin', 'geckodriver')
+    if os.path.exists(snap_geckodriver):
+        log.info("Using locally installed geckodriver at: %s", snap_geckodriver)
+        return snap_geckodriver
+
+    path_geckodriver = shutil.which("geckodriver")
+    if path_geckodriver:
+        log.info("Using geckodriver found on PATH at: %s", path_geckodriver)
+        return path_geckodriver
+
+    # Fallback to webdriver_manager to download if not found locally; the
+    # pinned version avoids the GitHub latest-release lookup, and the long
+    # cache validity stops the default daily re-check of the cached binary.
+    # Imported here so runs with a local driver never pay for the library
+    from webdriver_manager.core.driver_cache import DriverCacheManager
+    from webdriver_manager.firefox import GeckoDriverManager
+
+    log.info("Locally installed geckodriver not found, using webdriver_manager to install...")
+    geckodriver_path = GeckoDriverManager(
+        version=_GECKODRIVER_VERSION,
+        cache_manager=DriverCacheManager(valid_range=365),
+    ).install()
+    log.info("Geckodriver installed via webdriver_manager at: %s", geckodriver_path)
+    return geckodriver_path
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver():
+    """
+    Resolve the chromedriver binary path, cached for the process lifetime.
+
+    Resolution order mirrors _resolve_geckodriver: the CHROMEDRIVER_PATH
+    environment variable, any chromedriver on PATH, and finally
+    webdriver_manager.
+    """
+    env_path = os.getenv("CHROMEDRIVER_PATH")
+    if env_path:
+        log.info("Using chromedriver from CHROMEDRIVER_PATH: %s", env_path)
+        return env_path
+
+    path_chromedriver = shutil.which("chromedriver")
+    if path_chromedriver:
+        log.info("Using chromedriver found on PATH at: %s", path_chromedriver)
+        return path_chromedriver
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    log.info("Locally installed chromedriver not found, using webdriver_manager to install...")
+    chromedriver_path = ChromeDriverManager().install()
+    log.info("Chromedriver installed via webdriver_manager at: %s", chromedriver_path)
+    return chromedriver_path
+
+
+def _parse_schedule(spec):
+    """
+    Parse a schedule spec like "08:00:activate,22:00:deactivate".
+
+    Args:
+        spec: Comma-separated list of HH:MM:action entries
+
+    Returns:
+        List of (datetime.time, activate) tuples in the given order
+
+    Raises:
+        ValueError: If an entry is malformed or uses an unknown action
+    """
+    entries = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        try:
+            hour_minute, action = entry.rsplit(":", 1)
+            when = datetime.datetime.strptime(hour_minute, "%H:%M").time()
+        except ValueError:
+            raise ValueError(f"Invalid schedule entry: {entry!r} (expected HH:MM:action)")
+        if action not in ("activate", "deactivate"):
+            raise ValueError(f"Invalid schedule action: {action!r} (expected activate or deactivate)")
+        entries.append((when, action == "activate"))
+    return entries
+
+
+def _sleep_until(target_time):
+    """
+    Sleep until the given wall-clock time today.
+
+    Times that have already passed return immediately, so a schedule
+    started mid-list catches up without extra delay.
+
+    Args:
+        target_time: A datetime.time to wait for
+    """
+    now = datetime.datetime.now()
+    target = datetime.datetime.combine(now.date(), target_time)
+    remaining = (target - now).total_seconds()
+    if remaining > 0:
+        log.info("Waiting until %s (%.0fs)...", target_time.strftime("%H:%M"), remaining)
+        time.sleep(remaining)
 
 
 class AsusRouterConfigurator:
     """Handles Asus router configuration via Selenium WebDriver."""
     
-    def __init__(self, router_ip, username, password, headless=True, use_https=False):
+    def __init__(self, router_ip, username, password, headless=True, use_https=False,
+                 browser="firefox"):
         """
         Initialize the configurator.
-        
+
         Args:
             router_ip: Router IP address
             username: Router admin username
             password: Router admin password
             headless: Run browser in headless mode (default: True)
             use_https: Use HTTPS instead of HTTP (default: False)
+            browser: Browser to drive, "firefox" or "chrome" (default: firefox)
         """
         self.router_ip = router_ip
         self.username = username
@@ -50,64 +271,190 @@ class AsusRouterConfigurator:
         self.headless = headless
         self.use_https = use_https
         self.protocol = "https" if use_https else "http"
+        self.browser = browser
         self.driver = None
         self.wait = None
-        self.display = None
-        
+        # Per-router cache locations; see _router_cache_dir
+        cache_dir = _router_cache_dir(router_ip)
+        self._profile_dir = os.path.join(cache_dir, "firefox_profile")
+        self._chrome_profile_dir = os.path.join(cache_dir, "chrome_profile")
+        self._cookie_path = os.path.join(cache_dir, "cookies.json")
+
     def setup_driver(self):
-        """Set up and configure the Firefox WebDriver with virtual display for headless operation."""
-        # Start virtual display for headless operation (required for Raspberry Pi)
-        if self.headless:
-            self.display = Display(visible=0, size=(1024, 768))
-            self.display.start()
-            print("Virtual display started for headless operation")
-        
+        """Set up and configure the WebDriver for the selected browser."""
+        _load_selenium()
+
+        if self.browser == "chrome":
+            self._setup_chrome_driver()
+        else:
+            self._setup_firefox_driver()
+
+        self.wait = WebDriverWait(self.driver, 20)
+
+        log.info("%s WebDriver initialized successfully", self.browser.capitalize())
+
+    def _setup_firefox_driver(self):
+        """Configure and launch headless Firefox via geckodriver."""
         firefox_options = Options()
-        
-        # Firefox-specific options
-        firefox_options.set_preference("browser.privatebrowsing.autostart", False)
-        firefox_options.set_preference("network.http.phishy-userpass-length", 255)
-        firefox_options.set_preference("network.automatic-ntlm-auth.trusted-uris", self.router_ip)
-        
+
+        # Use Firefox's native headless mode (Firefox 55+), no Xvfb needed
+        if self.headless:
+            firefox_options.add_argument("-headless")
+            # Preserve the viewport size previously provided by the virtual display
+            os.environ.setdefault("MOZ_HEADLESS_WIDTH", "1024")
+            os.environ.setdefault("MOZ_HEADLESS_HEIGHT", "768")
+
+        # Reuse a persistent profile so Firefox keeps cookies between runs
+        os.makedirs(self._profile_dir, exist_ok=True)
+        firefox_options.add_argument("-profile")
+        firefox_options.add_argument(self._profile_dir)
+
+        # Firefox preferences: a profile primed by a previous run already has
+        # them in its user.js, so marshalling each one through geckodriver is
+        # only needed on a cold or changed profile
+        prefs = _firefox_prefs(self.router_ip)
+        primed = _profile_prefs_cached(prefs, self._profile_dir)
+        if primed:
+            log.info("Reusing primed Firefox profile, skipping preference setup")
+        else:
+            for name, value in prefs.items():
+                firefox_options.set_preference(name, value)
+
         # Accept insecure certificates (for routers with self-signed certs)
         firefox_options.accept_insecure_certs = True
+
+        # Enable WebDriver BiDi (geckodriver 0.33+) so waits can key off
+        # real browser events rather than wall-clock time
+        firefox_options.set_capability("webSocketUrl", True)
         
-        # Get the geckodriver path using webdriver_manager
-        # First try to use locally installed geckodriver from venv
-        venv_geckodriver = os.path.join('/snap', 'bin',, 'geckodriver')
-        
-        if os.path.exists(venv_geckodriver):
-            print(f"Using locally installed geckodriver at: {venv_geckodriver}")
-            geckodriver_path = venv_geckodriver
-        else:
-            # Fallback to webdriver_manager to download if not found locally
-            print("Locally installed geckodriver not found, using webdriver_manager to install...")
-            geckodriver_path = GeckoDriverManager().install()
-            print(f"Geckodriver installed via webdriver_manager at: {geckodriver_path}")
-        
-        # Create service with the geckodriver path
-        service = Service(executable_path=geckodriver_path)
+        # Create service with the resolved (and cached) geckodriver path
+        service = Service(executable_path=_resolve_geckodriver())
         
         # Initialize Firefox WebDriver
         self.driver = webdriver.Firefox(service=service, options=firefox_options)
-        self.wait = WebDriverWait(self.driver, 20)
-        
-        print("Firefox WebDriver initialized successfully")
-        
+
+        # Prime the profile so the next run skips the pref marshalling above
+        if not primed:
+            _write_profile_prefs(prefs, self._profile_dir)
+
+    def _setup_chrome_driver(self):
+        """Configure and launch headless Chromium via chromedriver."""
+        chrome_options = ChromeOptions()
+
+        if self.headless:
+            # "new" headless shares the regular browser codepaths (Chrome 109+)
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1024,768")
+
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        # /dev/shm is tiny on a Raspberry Pi; fall back to /tmp for shared memory
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-extensions")
+        # Same subresource trimming as the Firefox prefs
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+        # Reuse a persistent profile so Chromium keeps cookies between runs
+        os.makedirs(self._chrome_profile_dir, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={self._chrome_profile_dir}")
+
+        # Accept insecure certificates (for routers with self-signed certs)
+        chrome_options.accept_insecure_certs = True
+
+        # Create service with the resolved (and cached) chromedriver path
+        service = ChromeService(executable_path=_resolve_chromedriver())
+
+        # Initialize Chrome WebDriver
+        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    def _wait_for(self, condition_fn, timeout=10, start_interval=0.25, max_interval=2.0):
+        """
+        Poll a condition with exponential backoff until it holds or times out.
+
+        Unlike a fixed sleep, this returns as soon as the condition is met,
+        while backing off the poll interval to avoid hammering the router.
+
+        Args:
+            condition_fn: Callable taking the driver, returning truthy on success
+            timeout: Maximum seconds to wait
+            start_interval: Initial poll interval in seconds
+            max_interval: Cap for the backed-off interval in seconds
+
+        Returns:
+            True if the condition was met within the timeout, False otherwise
+        """
+        start = time.monotonic()
+        interval = start_interval
+        while time.monotonic() - start < timeout:
+            try:
+                if condition_fn(self.driver):
+                    return True
+            except Exception:
+                # Transient errors (e.g. stale elements mid-reload) count as
+                # "not yet"; keep polling until the timeout
+                pass
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+        return False
+
+    def _wait_for_page_load(self):
+        """Wait until the current document has fired its load event."""
+        self.wait.until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
+
+    def _restore_session(self):
+        """
+        Try to reuse cookies saved by a previous run.
+
+        Asus sessions outlive typical cron intervals, so reloading the
+        asus_token cookie usually skips the whole login flow.
+
+        Returns:
+            True if the saved cookies got us past the login page
+        """
+        if not os.path.exists(self._cookie_path):
+            return False
+        try:
+            with open(self._cookie_path) as f:
+                cookies = json.load(f)
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+            self.driver.refresh()
+            # A valid session is redirected away from the login page
+            return "Main_Login.asp" not in self.driver.current_url
+        except Exception as e:
+            log.warning("Could not restore saved session: %s", e)
+            return False
+
+    def _save_session(self):
+        """Persist the current session cookies for later runs to reuse."""
+        try:
+            os.makedirs(os.path.dirname(self._cookie_path), exist_ok=True)
+            with open(self._cookie_path, "w") as f:
+                json.dump(self.driver.get_cookies(), f)
+        except Exception as e:
+            log.warning("Could not save session cookies: %s", e)
+
     def login(self):
         """Log in to the router's WebUI."""
         try:
             # Navigate to router admin page
             #url = f"{self.protocol}://{self.router_ip}"
             url = f"http://{self.router_ip}/Main_Login.asp"
-            print(f"Navigating to {url}")
+            log.info("Navigating to %s", url)
             self.driver.get(url)
-            
-            # Wait for login page to load
-            time.sleep(5)
-            print("Current url (should be asusrouter.com/blablabla): ",self.driver.current_url)
+
+            # Reuse cookies from a previous run when still valid
+            if self._restore_session():
+                log.info("Reusing saved session, login form skipped")
+                return True
+
+            # Wait for the login form to appear instead of sleeping a fixed time
+            self.wait.until(EC.presence_of_element_located((By.NAME, "login_username")))
+            log.info("Current url (should be asusrouter.com/blablabla): %s", self.driver.current_url)
             # Find and fill username field
-            print("Attempting to log in...")
+            log.info("Attempting to log in...")
             username_field = self.driver.find_element(By.NAME, "login_username")
             username_field.clear()
             username_field.send_keys(self.username)
@@ -120,21 +467,28 @@ class AsusRouterConfigurator:
             # Submit login form
             login_button = self.driver.find_element(By.CLASS_NAME, "button")
             login_button.click()
-            
-            # Wait for dashboard to load
-            time.sleep(5)
-            
-            print("Successfully logged in to router")
+
+            # Wait for the session cookie the router sets on successful auth;
+            # the current URL is no signal here since the router already
+            # redirects to www.asusrouter.com before credentials are submitted
+            self.wait.until(
+                lambda d: any(c["name"] == "asus_token" for c in d.get_cookies())
+            )
+
+            # Save cookies so the next run can skip the login form
+            self._save_session()
+
+            log.info("Successfully logged in to router")
             return True
             
         except TimeoutException:
-            print("ERROR: Timeout while trying to log in")
+            log.error("Timeout while trying to log in")
             return False
         except NoSuchElementException as e:
-            print(f"ERROR: Could not find login element: {e}")
+            log.error("Could not find login element: %s", e)
             return False
         except Exception as e:
-            print(f"ERROR: Unexpected error during login: {e}")
+            log.error("Unexpected error during login: %s", e)
             return False
     
     def navigate_to_url_filter(self):
@@ -142,7 +496,7 @@ class AsusRouterConfigurator:
         try:
             # Asus routers typically have URL Filter under:
             # Advanced Settings -> Firewall -> URL Filter
-            print("Navigating to URL Filter page...")
+            log.info("Navigating to URL Filter page...")
             
             # Navigate directly to the URL filter page
             # The exact URL may vary by router model, common paths:
@@ -153,15 +507,17 @@ class AsusRouterConfigurator:
             # Try the most common URL path first
             filter_url = "http://www.asusrouter.com/Advanced_URLFilter_Content.asp"
             self.driver.get(filter_url)
-            
-            time.sleep(5)
-            print("Navigated to URL Filter page")
-            print(f"Note: If this page is incorrect, the URL path may vary by router model.")
-            print(f"      Check your router's admin interface for the correct path.")
+
+            # Wait for the load event, then for the filter controls themselves
+            self._wait_for_page_load()
+            self.wait.until(EC.presence_of_all_elements_located((By.NAME, "url_enable_x")))
+            log.info("Navigated to URL Filter page")
+            log.info("Note: If this page is incorrect, the URL path may vary by router model.")
+            log.info("      Check your router's admin interface for the correct path.")
             return True
             
         except Exception as e:
-            print(f"ERROR: Failed to navigate to URL filter page: {e}")
+            log.error("Failed to navigate to URL filter page: %s", e)
             return False
     
     def set_url_filter_state(self, activate):
@@ -177,48 +533,65 @@ class AsusRouterConfigurator:
         """
         try:
             action = "Activating" if activate else "Deactivating"
-            print(f"{action} URL filtering...")
+            log.info("%s URL filtering...", action)
             
-            # Find radio buttons by name attribute
-            # The first element is Enable, the second is Disable
-            radio_buttons = self.driver.find_elements(By.NAME, "url_enable_x")
-            
-            if len(radio_buttons) < 2:
+            # Flip the radio and press Apply in a single script call: each
+            # WebDriver command is a synchronous round-trip to geckodriver,
+            # so fusing the lookups and clicks collapses four RPCs into one.
+            # Both elements are checked before anything is clicked, so a
+            # missing one reports which instead of a half-applied state.
+            # The first radio is Enable, the second is Disable.
+            missing = self.driver.execute_script(
+                """
+                var radios = document.getElementsByName('url_enable_x');
+                var apply = document.querySelector("input[value='Apply']");
+                if (radios.length < 2 || !apply) {
+                    return {radios: radios.length, apply: Boolean(apply)};
+                }
+                radios[arguments[0] ? 0 : 1].click();
+                apply.click();
+                return null;
+                """,
+                activate,
+            )
+
+            if missing is not None:
+                if missing["radios"] < 2:
+                    raise Exception(
+                        f"URL filtering radio buttons not found or incomplete. "
+                        f"Expected 2 radio buttons with name=\"url_enable_x\", found {missing['radios']}. "
+                        f"Please verify the router interface or check element selectors."
+                    )
                 raise Exception(
-                    f"URL filtering radio buttons not found or incomplete. "
-                    f"Expected 2 radio buttons with name=\"url_enable_x\", found {len(radio_buttons)}. "
-                    f"Please verify the router interface or check element selectors."
+                    "Apply button not found. Expected an input with value=\"Apply\". "
+                    "Please verify the router interface or check element selectors."
                 )
-            
-            if activate:
-                # Click the first radio button (Enable)
-                radio_buttons[0].click()
-            else:
-                # Click the second radio button (Disable)
-                radio_buttons[1].click()
-            
-            time.sleep(1)
-            
-            # Apply changes - find apply button (button is always present)
-            apply_button = self.driver.find_element(By.XPATH, "//input[@value='Apply']")
-            apply_button.click()
-            
-            time.sleep(3)
-            
+
+            # Poll until the form reflects the new state (the router may
+            # reload the page or apply in place); adaptive backoff returns
+            # on first success instead of a worst-case sleep
+            def _state_applied(driver):
+                radios = driver.find_elements(By.NAME, "url_enable_x")
+                return len(radios) >= 2 and radios[0 if activate else 1].is_selected()
+
+            if not self._wait_for(_state_applied):
+                log.warning("Could not confirm the new filter state; "
+                            "the router may still be applying changes")
+
             state = "activated" if activate else "deactivated"
-            print(f"URL filtering successfully {state}")
+            log.info("URL filtering successfully %s", state)
             return True
             
         except TimeoutException:
-            print(f"ERROR: Timeout while trying to {action.lower()} URL filtering")
-            print("Note: Element IDs may vary by router model. Manual configuration may be needed.")
+            log.error("Timeout while trying to %s URL filtering", action.lower())
+            log.info("Note: Element IDs may vary by router model. Manual configuration may be needed.")
             return False
         except NoSuchElementException as e:
-            print(f"ERROR: Could not find URL filter element: {e}")
-            print("Note: The router WebUI structure may differ from expected. Check element IDs.")
+            log.error("Could not find URL filter element: %s", e)
+            log.info("Note: The router WebUI structure may differ from expected. Check element IDs.")
             return False
         except Exception as e:
-            print(f"ERROR: Unexpected error while configuring URL filter: {e}")
+            log.error("Unexpected error while configuring URL filter: %s", e)
             return False
     
     def configure(self, activate):
@@ -243,23 +616,241 @@ class AsusRouterConfigurator:
             if not self.set_url_filter_state(activate):
                 return False
             
-            print("Configuration completed successfully!")
+            log.info("Configuration completed successfully!")
             return True
             
         except Exception as e:
-            print(f"ERROR: Configuration failed: {e}")
+            log.error("Configuration failed: %s", e)
             return False
         finally:
             if self.driver:
                 self.driver.quit()
-                print("Browser closed")
-            if self.display:
-                self.display.stop()
-                print("Virtual display stopped")
+                log.info("Browser closed")
+
+    async def configure_async(self, activate):
+        """
+        Run configure() without blocking the event loop.
+
+        Selenium itself is synchronous, so the work runs in the default
+        executor; callers managing several routers can gather these
+        coroutines for near-linear speedup on this I/O-bound workload.
+
+        Args:
+            activate: True to activate filtering, False to deactivate
+
+        Returns:
+            True if successful, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.configure, activate)
+
+    def configure_schedule(self, entries):
+        """
+        Run a batch of timed toggles in a single browser session.
+
+        Launching Firefox and logging in once and reusing the session for
+        every entry amortizes the ~10s startup across the whole schedule,
+        instead of paying it per toggle via separate cron invocations.
+
+        Args:
+            entries: List of (datetime.time, activate) tuples in order
+
+        Returns:
+            True if every toggle succeeded, False otherwise
+        """
+        try:
+            self.setup_driver()
+
+            if not self.login():
+                return False
+
+            if not self.navigate_to_url_filter():
+                return False
+
+            for when, activate in entries:
+                _sleep_until(when)
+                if not self.set_url_filter_state(activate):
+                    return False
+
+            log.info("Schedule completed successfully!")
+            return True
+
+        except Exception as e:
+            log.error("Configuration failed: %s", e)
+            return False
+        finally:
+            if self.driver:
+                self.driver.quit()
+                log.info("Browser closed")
+
+
+class AsusRouterHttpConfigurator:
+    """
+    Handles Asus router configuration via plain HTTP requests.
+
+    Flipping the URL filter is ultimately a single form POST to the
+    router's CGI endpoint, so this avoids launching Firefox/geckodriver
+    entirely and completes in milliseconds instead of tens of seconds.
+    Works with stock Asus firmware's token-based login scheme.
+    """
+
+    def __init__(self, router_ip, username, password, use_https=False, timeout=10):
+        """
+        Initialize the configurator.
+
+        Args:
+            router_ip: Router IP address
+            username: Router admin username
+            password: Router admin password
+            use_https: Use HTTPS instead of HTTP (default: False)
+            timeout: Per-request timeout in seconds (default: 10)
+        """
+        _load_requests()
+        self.router_ip = router_ip
+        self.username = username
+        self.password = password
+        self.protocol = "https" if use_https else "http"
+        self.timeout = timeout
+        self.base_url = f"{self.protocol}://{self.router_ip}"
+        self.session = requests.Session()
+        if use_https:
+            # Routers typically use self-signed certificates
+            self.session.verify = False
+
+    def login(self):
+        """Log in to the router and obtain the asus_token session cookie."""
+        try:
+            log.info("Logging in to %s via HTTP...", self.base_url)
+            auth = base64.b64encode(
+                f"{self.username}:{self.password}".encode()
+            ).decode()
+            response = self.session.post(
+                f"{self.base_url}/login.cgi",
+                data={"login_authorization": auth},
+                headers={"Referer": f"{self.base_url}/Main_Login.asp"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            if "asus_token" not in self.session.cookies:
+                log.error("Login did not return an asus_token cookie")
+                log.error("Check the router credentials and firmware version")
+                return False
+
+            log.info("Successfully logged in to router")
+            return True
+
+        except requests.RequestException as e:
+            log.error("HTTP login failed: %s", e)
+            return False
+
+    def set_url_filter_state(self, activate):
+        """
+        Enable or disable URL filtering via the apply endpoint.
+
+        Args:
+            activate: True to enable, False to disable
+        """
+        try:
+            action = "Activating" if activate else "Deactivating"
+            log.info("%s URL filtering...", action)
+
+            response = self.session.post(
+                f"{self.base_url}/start_apply.htm",
+                data={
+                    "current_page": "Advanced_URLFilter_Content.asp",
+                    "next_page": "",
+                    "action_mode": "apply",
+                    "action_script": "restart_firewall",
+                    "url_enable_x": "1" if activate else "0",
+                },
+                headers={
+                    "Referer": f"{self.base_url}/Advanced_URLFilter_Content.asp"
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            state = "activated" if activate else "deactivated"
+            log.info("URL filtering successfully %s", state)
+            return True
+
+        except requests.RequestException as e:
+            log.error("Failed while %s URL filtering: %s", action.lower(), e)
+            return False
+
+    def configure(self, activate):
+        """
+        Main configuration method.
+
+        Args:
+            activate: True to activate filtering, False to deactivate
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not self.login():
+                return False
+
+            if not self.set_url_filter_state(activate):
+                return False
+
+            log.info("Configuration completed successfully!")
+            return True
+
+        except Exception as e:
+            log.error("Configuration failed: %s", e)
+            return False
+        finally:
+            self.session.close()
+
+    async def configure_async(self, activate):
+        """
+        Run configure() without blocking the event loop.
+
+        Args:
+            activate: True to activate filtering, False to deactivate
+
+        Returns:
+            True if successful, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.configure, activate)
+
+    def configure_schedule(self, entries):
+        """
+        Run a batch of timed toggles over a single logged-in session.
+
+        Args:
+            entries: List of (datetime.time, activate) tuples in order
+
+        Returns:
+            True if every toggle succeeded, False otherwise
+        """
+        try:
+            if not self.login():
+                return False
+
+            for when, activate in entries:
+                _sleep_until(when)
+                if not self.set_url_filter_state(activate):
+                    return False
+
+            log.info("Schedule completed successfully!")
+            return True
+
+        except Exception as e:
+            log.error("Configuration failed: %s", e)
+            return False
+        finally:
+            self.session.close()
 
 
 def main():
     """Main entry point for the script."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
     parser = argparse.ArgumentParser(
         description="Configure Asus Router URL Filtering via Selenium",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -278,8 +869,17 @@ Environment Variables:
     
     parser.add_argument(
         "action",
+        nargs="?",
         choices=["activate", "deactivate"],
-        help="Action to perform: activate or deactivate URL filtering"
+        help="Action to perform: activate or deactivate URL filtering "
+             "(omit when using --schedule)"
+    )
+
+    parser.add_argument(
+        "--schedule",
+        help="Comma-separated timed actions to run in one session, e.g. "
+             "\"08:00:activate,22:00:deactivate\". Amortizes browser "
+             "startup and login across all toggles"
     )
     
     parser.add_argument(
@@ -287,6 +887,12 @@ Environment Variables:
         default=os.getenv("ROUTER_IP", "192.168.0.1"),
         help="Router IP address (default: 192.168.0.1 or ROUTER_IP env var)"
     )
+
+    parser.add_argument(
+        "--routers",
+        help="Comma-separated list of router IPs to configure concurrently "
+             "(overrides --router-ip; all share the same credentials)"
+    )
     
     parser.add_argument(
         "--username",
@@ -300,6 +906,22 @@ Environment Variables:
         help="Router admin password (default: ROUTER_PASSWORD env var)"
     )
     
+    parser.add_argument(
+        "--mode",
+        choices=["http", "selenium"],
+        default="http",
+        help="How to talk to the router: direct HTTP POST (fast, default) "
+             "or Selenium-driven browser (fallback for unusual firmwares)"
+    )
+
+    parser.add_argument(
+        "--browser",
+        choices=["firefox", "chrome"],
+        default="firefox",
+        help="Browser to drive in selenium mode (default: firefox; chrome "
+             "starts faster and uses less memory on constrained hardware)"
+    )
+
     parser.add_argument(
         "--headless",
         action="store_true",
@@ -322,25 +944,58 @@ Environment Variables:
     )
     
     args = parser.parse_args()
-    
+
+    # Validate action/schedule combination
+    if bool(args.action) == bool(args.schedule):
+        parser.error("provide either an action (activate/deactivate) or --schedule, not both")
+
+    schedule = None
+    if args.schedule:
+        try:
+            schedule = _parse_schedule(args.schedule)
+        except ValueError as e:
+            parser.error(str(e))
+
     # Validate password
     if not args.password:
-        print("ERROR: Router password is required!")
-        print("Provide it via --password argument or ROUTER_PASSWORD environment variable")
+        log.error("Router password is required!")
+        log.error("Provide it via --password argument or ROUTER_PASSWORD environment variable")
         sys.exit(1)
     
-    # Create configurator instance
-    configurator = AsusRouterConfigurator(
-        router_ip=args.router_ip,
-        username=args.username,
-        password=args.password,
-        headless=args.headless,
-        use_https=args.use_https
-    )
-    
+    def make_configurator(router_ip):
+        if args.mode == "http":
+            return AsusRouterHttpConfigurator(
+                router_ip=router_ip,
+                username=args.username,
+                password=args.password,
+                use_https=args.use_https
+            )
+        return AsusRouterConfigurator(
+            router_ip=router_ip,
+            username=args.username,
+            password=args.password,
+            headless=args.headless,
+            use_https=args.use_https,
+            browser=args.browser
+        )
+
     # Perform configuration
-    activate = args.action == "activate"
-    success = configurator.configure(activate)
+    if args.routers:
+        if schedule:
+            parser.error("--routers cannot be combined with --schedule")
+        router_ips = [ip.strip() for ip in args.routers.split(",") if ip.strip()]
+        activate = args.action == "activate"
+
+        async def configure_all():
+            return await asyncio.gather(
+                *[make_configurator(ip).configure_async(activate) for ip in router_ips]
+            )
+
+        success = all(asyncio.run(configure_all()))
+    elif schedule:
+        success = make_configurator(args.router_ip).configure_schedule(schedule)
+    else:
+        success = make_configurator(args.router_ip).configure(args.action == "activate")
     
     # Exit with appropriate status code
     sys.exit(0 if success else 1)
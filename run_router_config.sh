@@ -50,19 +50,24 @@ print_error() {
 
 # Check if action argument is provided
 if [ $# -lt 1 ]; then
-    print_error "Usage: $0 {activate|deactivate} [additional args]"
+    print_error "Usage: $0 {activate|deactivate|--schedule ...} [additional args]"
     exit 1
 fi
 
 ACTION="$1"
 shift  # Remove first argument, keep the rest for passing to Python script
 
-# Validate action
-if [ "$ACTION" != "activate" ] && [ "$ACTION" != "deactivate" ]; then
-    print_error "Invalid action: $ACTION"
-    print_error "Action must be 'activate' or 'deactivate'"
-    exit 1
-fi
+# Validate action; option-style arguments (e.g. --schedule) are passed
+# through to the Python script, which validates them itself
+case "$ACTION" in
+    activate|deactivate|--*)
+        ;;
+    *)
+        print_error "Invalid action: $ACTION"
+        print_error "Action must be 'activate' or 'deactivate' (or an option like --schedule)"
+        exit 1
+        ;;
+esac
 
 # Check if Python 3 is installed
 if ! command -v python3 &> /dev/null; then